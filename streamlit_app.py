@@ -1,9 +1,19 @@
+import hashlib
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
+import numpy as np
 import gspread
+from gspread.utils import absolute_range_name, fill_gaps, rowcol_to_a1
 import altair as alt
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
-from datetime import date
+from requests.adapters import HTTPAdapter
 
 # ─────────────────────
 # 0. 기본 설정
@@ -15,8 +25,27 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# 문자열형(string) 컬럼은 PyArrow 저장 방식 사용 (parquet 스냅샷을 읽을 때도 동일)
+pd.set_option("mode.string_storage", "pyarrow")
+
 SPREADSHEET_ID = st.secrets["SPREADSHEET_ID"]
 
+# 시트 스냅샷(parquet) 저장 위치: 같은 서버의 모든 세션·워커가 공유
+SNAPSHOT_DIR = Path(tempfile.gettempdir()) / "tf_dashboard_cache"
+
+# 사이드바 필터에 쓰는 저카디널리티 컬럼 (load_data에서 category형으로 변환)
+CATEGORY_COLS = ["평가영역", "평가준거", "주무부처"]
+
+# 표시등 값 (위험순 정렬 순서)
+INDICATOR_LEVELS = ["🔴", "🟡", "🔵"]
+
+# 표시등 판정용 진행상태 집합 (모듈 로드 시 한 번만 생성)
+DANGER_STATES = frozenset({"중단", "이슈", "문제", "보류"})
+WARN_STATES = frozenset({"지연", "늦음"})
+
+# 상세 목록에 한 번에 표시할 최대 행 수 (초과 시 구간 슬라이더로 나눠 표시)
+TABLE_PAGE_ROWS = 500
+
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets.readonly",
     "https://www.googleapis.com/auth/drive.readonly",
@@ -29,59 +58,182 @@ SCOPES = [
 
 @st.cache_resource
 def get_gsheet_client():
-    """서비스 계정으로 gspread 클라이언트 생성 (읽기 전용 스코프)"""
+    """
+    서비스 계정으로 gspread 클라이언트 생성 (읽기 전용 스코프)
+    연결 풀을 둔 인증 세션을 재사용해 호출마다 TCP/TLS 연결을 새로 맺지 않는다.
+    """
     credentials = Credentials.from_service_account_info(
         st.secrets["gcp_service_account"],
         scopes=SCOPES,
     )
-    gc = gspread.authorize(credentials)
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3)
+    session.mount("https://", adapter)
+    gc = gspread.Client(auth=credentials, session=session)
     return gc
 
 
-@st.cache_data(ttl=60)
-def load_data():
+@st.cache_data(ttl=60, show_spinner=False)
+def get_sheet_state() -> tuple[str, str | None]:
+    """
+    스프레드시트 최종 수정 시각(Drive API)과 읽어 올 시트 범위(Sheets 메타데이터)를
+    동시에 조회한다. 둘 다 값 전체를 받지 않는 가벼운 호출이고 서로 독립적이라
+    순차 호출 대신 병렬로 보내 대기 시간을 한 번으로 줄인다.
+
+    반환: (modifiedTime, 시트 범위) — 시트가 하나도 없으면 범위는 None
+    """
+    http = get_gsheet_client().http_client
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_drive = ex.submit(http.get_file_drive_metadata, SPREADSHEET_ID)
+        # 탭 제목·크기만 조회 (탭마다 워크시트 객체를 만들지 않음)
+        f_sheets = ex.submit(
+            http.fetch_sheet_metadata,
+            SPREADSHEET_ID,
+            {"fields": "sheets.properties(title,gridProperties)"},
+        )
+        modified_time = f_drive.result()["modifiedTime"]
+        sheets = [s["properties"] for s in f_sheets.result().get("sheets", [])]
+
+    if not sheets:
+        return modified_time, None
+
+    # '증빙자료' 문자열 포함 시트 우선 사용, 없으면 첫 번째 시트 사용
+    target = next((p for p in sheets if "증빙자료" in p["title"]), sheets[0])
+
+    # 시트의 실제 행·열 크기까지만 범위를 잡아 빈 영역을 받아오지 않음
+    grid = target.get("gridProperties", {})
+    last_cell = rowcol_to_a1(grid.get("rowCount", 1), grid.get("columnCount", 1))
+    return modified_time, absolute_range_name(target["title"], f"A1:{last_cell}")
+
+
+def _snapshot_path(modified_time: str) -> Path:
+    """시트 ID + 수정 시각으로 디스크 스냅샷 파일 경로를 만든다."""
+    sheet_key = hashlib.sha1(SPREADSHEET_ID.encode("utf-8")).hexdigest()[:12]
+    rev_key = hashlib.sha1(modified_time.encode("utf-8")).hexdigest()[:12]
+    return SNAPSHOT_DIR / f"{sheet_key}_{rev_key}.parquet"
+
+
+def read_snapshot(modified_time: str) -> pd.DataFrame | None:
+    """같은 수정 시각의 디스크 스냅샷이 있으면 읽어 온다 (없거나 깨졌으면 None)."""
+    path = _snapshot_path(modified_time)
+    if not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        return None
+
+
+def write_snapshot(modified_time: str, df: pd.DataFrame) -> None:
+    """
+    정리된 DataFrame을 디스크 스냅샷으로 저장한다.
+    같은 시트의 이전 수정 시각 스냅샷은 지운다. 실패해도 대시보드에는 영향 없음.
+    """
+    path = _snapshot_path(modified_time)
+    try:
+        SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+        sheet_key = path.name.split("_", 1)[0]
+        for old in SNAPSHOT_DIR.glob(f"{sheet_key}_*.parquet"):
+            old.unlink(missing_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        df.to_parquet(tmp_path, index=False)
+        tmp_path.replace(path)
+    except Exception:
+        pass
+
+
+def _sorted_unique(s: pd.Series) -> list:
+    """결측을 뺀 고유값을 해시 기반 pd.unique + NumPy 정렬로 뽑아 목록으로 반환."""
+    values = pd.unique(s.dropna().to_numpy())
+    values.sort()
+    return values.tolist()
+
+
+def split_owners(owners: pd.Series) -> pd.Series:
+    """
+    담당자 셀을 이름 단위로 분리한다 (한 셀에 "/" 또는 ","로 여러 명 입력 가능).
+    문자열 메서드 + explode로 처리하며, 결과의 인덱스는 원래 행 인덱스를 그대로 가진다.
+    (담당자 컬럼은 fetch_sheet_frame에서 빈 값이 ""인 문자열형으로 정리되어 있음)
+    """
+    return (
+        owners.str.replace("/", ",", regex=False)
+        .str.split(",")
+        .explode()
+        .str.strip()
+    )
+
+
+@st.cache_data(max_entries=4)
+def load_data(modified_time: str, value_range: str | None, today: str):
     """
     구글 시트에서 '증빙자료'라는 글자가 들어간 시트를 찾아
     전체 데이터를 DataFrame으로 반환한다.
     (여기서는 어떤 쓰기도 하지 않음: 완전 읽기 전용)
+
+    modified_time, value_range는 get_sheet_state()의 결과이다.
+    시트가 수정되지 않았으면 같은 키로 호출되므로 시트 값을 다시 받지 않는다.
+    프로세스 재시작·다른 워커에서도 디스크 스냅샷이 있으면 그것을 먼저 쓴다.
+    today(ISO 날짜)는 날짜가 바뀌면 마감일 기준 표시등을 다시 계산하기 위한 캐시 키이다.
+
+    반환: (df, 사이드바 필터별 선택지 목록 dict)
     """
-    gc = get_gsheet_client()
-    sh = gc.open_by_key(SPREADSHEET_ID)
+    df = read_snapshot(modified_time)
+    if df is None:
+        df = fetch_sheet_frame(value_range)
+        if not df.empty:
+            write_snapshot(modified_time, df)
 
-    worksheets = sh.worksheets()
+    categories = {}
+    if df.empty:
+        return df, categories
 
-    # '증빙자료' 문자열 포함 시트 우선 사용, 없으면 첫 번째 시트 사용
-    target_ws = None
-    for ws in worksheets:
-        if "증빙자료" in ws.title:
-            target_ws = ws
-            break
+    # 표시등은 시트 값과 날짜에만 의존하므로 여기서 한 번 계산해 함께 캐시
+    df["표시등"] = calc_indicators_vec(df)
 
-    if target_ws is None:
-        target_ws = worksheets[0]
+    # 필터용 컬럼은 category형으로 바꿔 == 비교를 정수 코드 비교로 처리하고,
+    # 사이드바 선택지는 이미 정렬된 categories를 그대로 써서 함께 캐시
+    for col in CATEGORY_COLS:
+        df[col] = df[col].astype("category")
+        categories[col] = df[col].cat.categories.tolist()
+    # 진행상태는 사이드바 필터는 아니지만 값 종류가 적어 category형으로 보관
+    # (표시등 계산이 끝난 뒤에 바꿔야 문자열 정리 단계와 충돌하지 않음)
+    df["진행상태"] = df["진행상태"].astype("category")
 
-    ws = target_ws
+    # 담당자는 한 셀에 여러 명(/, 구분)이 들어갈 수 있어 이름 단위로 분리
+    owner_tokens = split_owners(df["담당자"])
+    categories["담당자"] = _sorted_unique(owner_tokens[owner_tokens != ""])
+    return df, categories
 
-    values = ws.get_all_values()  # [[행1], [행2], ...]
+
+def fetch_sheet_frame(value_range: str | None) -> pd.DataFrame:
+    """value_range의 구글 시트 값을 받아 헤더·필수 컬럼·자료형을 정리한 DataFrame을 만든다."""
+    if value_range is None:
+        return pd.DataFrame()
+
+    http = get_gsheet_client().http_client
+    resp = http.values_batch_get(
+        SPREADSHEET_ID,
+        [value_range],
+        params={"majorDimension": "ROWS", "valueRenderOption": "FORMATTED_VALUE"},
+    )
+    values = resp["valueRanges"][0].get("values", [])  # [[행1], [행2], ...]
     if not values:
         return pd.DataFrame()
 
+    # API는 행 끝의 빈 칸을 생략하므로 get_all_values()처럼 길이를 맞춤
+    values = fill_gaps(values)
+
     raw_header = values[0]
     data_rows = values[1:]
 
     # 헤더(1행)에 빈칸·중복 있으면 자동 이름 부여
     header = []
-    seen = {}
+    seen = defaultdict(int)
     for idx, h in enumerate(raw_header):
-        name = (h or "").strip()
-        if name == "":
-            name = f"col_{idx+1}"
-        base = name
-        count = seen.get(base, 0)
-        if count > 0:
-            name = f"{base}_{count+1}"
-        seen[base] = count + 1
-        header.append(name)
+        name = (h or "").strip() or f"col_{idx+1}"
+        count = seen[name]
+        seen[name] = count + 1
+        header.append(name if count == 0 else f"{name}_{count+1}")
 
     df = pd.DataFrame(data_rows, columns=header)
 
@@ -103,17 +255,25 @@ def load_data():
         if col not in df.columns:
             df[col] = ""
 
-    # 진행률 숫자형 정리 (0~100)
+    # 진행률 숫자형 정리 (0~100, 값 범위가 작아 int8로 저장)
     df["진행률"] = (
         pd.to_numeric(df["진행률"], errors="coerce")
         .fillna(0)
         .clip(0, 100)
-        .astype(int)
+        .astype("int8")
     )
 
     # 마감일 날짜형 정리
     df["마감일"] = pd.to_datetime(df["마감일"], errors="coerce")
 
+    # 나머지 텍스트 컬럼은 PyArrow 문자열형으로 (비교·groupby를 Arrow 커널로 처리)
+    # pandas 3의 기본 str형도 함께 고르도록 "string"을 명시 (pandas 2에서는 해당 없음)
+    text_cols = df.select_dtypes(include=["object", "string"]).columns
+    df = df.astype({c: "string[pyarrow]" for c in text_cols})
+
+    # 담당자는 필터·표시등·집계에서 모두 쓰므로 빈 값을 여기서 한 번만 ""로 정리
+    df["담당자"] = df["담당자"].fillna("")
+
     return df
 
 
@@ -121,96 +281,115 @@ def load_data():
 # 2. 표시등(신호등) 계산 함수
 # ─────────────────────
 
-def calc_indicator(row: pd.Series) -> str:
+def calc_indicators_vec(df: pd.DataFrame) -> pd.Series:
     """
-    표시등 규칙:
+    표시등 규칙 (열 단위 벡터 연산으로 전체 행을 한 번에 계산):
 
     🔴 (위험):
       - 마감일 지났고 진행률 < 100
       - 담당자 없음
-      - 진행상태 ∈ ["중단", "이슈", "문제", "보류"]
+      - 진행상태 ∈ DANGER_STATES ("중단", "이슈", "문제", "보류")
       - 진행률 <= 30
 
     🟡 (주의):
       - 마감일까지 7일 이하 남았고 미완료
       - 30 < 진행률 <= 70
-      - 진행상태 ∈ ["지연", "늦음"]
+      - 진행상태 ∈ WARN_STATES ("지연", "늦음")
 
     🔵 (정상):
       - 위 조건에 해당하지 않으면 모두 파랑
     """
-    today = date.today()
-    progress = int(row.get("진행률", 0))
-    status = (row.get("진행상태", "") or "").strip()
-    owner = (row.get("담당자", "") or "").strip()
-    due = row.get("마감일", None)
-
-    if isinstance(due, str):
-        try:
-            due = pd.to_datetime(due, errors="coerce")
-        except Exception:
-            due = None
-
-    if isinstance(due, pd.Timestamp):
-        due_date = due.date()
-    else:
-        due_date = None
+    # 마감일(load_data에서 datetime64로 정리됨)을 일 단위로 잘라 오늘과의 차이를 정수 일수로 계산
+    due_days = df["마감일"].to_numpy().astype("datetime64[D]")
+    has_due = ~np.isnat(due_days)
+    delta_days = (due_days - np.datetime64(date.today(), "D")).astype("int64")
+    progress = df["진행률"].to_numpy()
+    owner = df["담당자"].str.strip().to_numpy()  # fetch_sheet_frame에서 빈 값을 ""로 정리함
+    status = df["진행상태"].fillna("").astype(str).str.strip()
+
+    incomplete = progress < 100
 
     # 🔴 위험
-    if due_date and due_date < today and progress < 100:
-        return "🔴"
-    if owner == "":
-        return "🔴"
-    if status in ["중단", "이슈", "문제", "보류"]:
-        return "🔴"
-    if progress <= 30:
-        return "🔴"
+    overdue = has_due & (delta_days < 0) & incomplete
+    no_owner = owner == ""
+    bad_status = status.isin(DANGER_STATES).to_numpy()
+    low = progress <= 30
+    red = overdue | no_owner | bad_status | low
 
     # 🟡 주의
-    if due_date and 0 <= (due_date - today).days <= 7 and progress < 100:
-        return "🟡"
-    if 30 < progress <= 70:
-        return "🟡"
-    if status in ["지연", "늦음"]:
-        return "🟡"
+    due_soon = has_due & (delta_days >= 0) & (delta_days <= 7) & incomplete
+    mid = (progress > 30) & (progress <= 70)
+    late_status = status.isin(WARN_STATES).to_numpy()
+    yellow = due_soon | mid | late_status
 
     # 🔵 정상
-    return "🔵"
+    # 🔴 < 🟡 < 🔵 순서형 category로 반환해 위험순 정렬에 그대로 사용
+    return pd.Series(
+        pd.Categorical(
+            np.select([red, yellow], ["🔴", "🟡"], default="🔵"),
+            categories=INDICATOR_LEVELS,
+            ordered=True,
+        ),
+        index=df.index,
+    )
 
 
 # ─────────────────────
 # 3. 공식 보고서 텍스트 생성 함수
 # ─────────────────────
 
-def generate_official_report_text(df: pd.DataFrame) -> str:
+def due_masks(df: pd.DataFrame, today64: np.datetime64) -> tuple[np.ndarray, np.ndarray]:
+    """
+    미완료 항목 중 마감 경과(지연) / 7일 이내 마감 마스크를 numpy bool 배열로 반환.
+    마감일은 load_data에서 이미 datetime64로 정리됨 → 일 단위로만 내려서 비교한다.
+    """
+    dates = df["마감일"].to_numpy().astype("datetime64[D]")
+    incomplete = df["진행률"].to_numpy() < 100
+    week64 = today64 + np.timedelta64(7, "D")
+    overdue_mask = (dates < today64) & incomplete
+    due_soon_mask = (dates >= today64) & (dates <= week64) & incomplete
+    return overdue_mask, due_soon_mask
+
+
+def generate_official_report_text(
+    df: pd.DataFrame,
+    *,
+    overdue_mask: np.ndarray | None = None,
+    due_soon_mask: np.ndarray | None = None,
+) -> str:
     """
     필터/정렬된 df를 받아서,
     공식 보고서 형태의 텍스트를 만들어 문자열로 반환.
     (이 문자열을 .txt로 다운로드 → 한글/워드에 붙여넣어 PDF로 저장)
+
+    overdue_mask / due_soon_mask: main()에서 상단 요약 카드용으로 이미 구한
+    지연·7일 이내 마감 마스크(df 행 순서 기준). 주어지면 다시 계산하지 않는다.
     """
-    today_str = pd.Timestamp.today().strftime("%Y-%m-%d")
+    # 기준일은 한 번만 구해 일(day) 단위 datetime64로 비교 (Timestamp 생성 반복 없음)
+    today = date.today()
+    today_str = today.isoformat()
+    today64 = np.datetime64(today, "D")
 
     total = len(df)
     done = int((df["진행률"] == 100).sum()) if total > 0 else 0
     avg_progress = float(df["진행률"].mean()) if total > 0 else 0.0
 
-    red = int((df["표시등"] == "🔴").sum())
-    yellow = int((df["표시등"] == "🟡").sum())
-    blue = int((df["표시등"] == "🔵").sum())
+    # 표시등별 개수는 category 정수 코드(🔴=0, 🟡=1, 🔵=2)에 bincount 한 번으로 구함
+    red, yellow, blue = (
+        int(c) for c in np.bincount(df["표시등"].cat.codes.to_numpy(), minlength=3)
+    )
 
+    # 지연/7일 이내 마감 마스크와 날짜 문자열은 한 번만 만들어
+    # 종합 요약 집계와 마감 임박 목록에서 함께 사용
+    has_due = "마감일" in df.columns
     overdue = 0
     due_soon = 0
-    if "마감일" in df.columns:
-        dates = pd.to_datetime(df["마감일"], errors="coerce")
-        today_ts = pd.Timestamp.today().normalize()
-        overdue = int(((dates < today_ts) & (df["진행률"] < 100)).sum())
-        due_soon = int(
-            (
-                (dates >= today_ts)
-                & (dates <= today_ts + pd.Timedelta(days=7))
-                & (df["진행률"] < 100)
-            ).sum()
-        )
+    if has_due:
+        if overdue_mask is None or due_soon_mask is None:
+            overdue_mask, due_soon_mask = due_masks(df, today64)
+        overdue = int(overdue_mask.sum())
+        due_soon = int(due_soon_mask.sum())
+        due_strs = df["마감일"].dt.strftime("%Y-%m-%d").fillna("")
 
     lines = []
     add = lines.append
@@ -234,18 +413,10 @@ def generate_official_report_text(df: pd.DataFrame) -> str:
 
     # 2. 마감 임박/지연
     add("2. 마감 임박 또는 지연 항목 현황")
-    if "마감일" in df.columns:
-        dates = pd.to_datetime(df["마감일"], errors="coerce")
-        today_ts = pd.Timestamp.today().normalize()
-        cond = (
-            ((dates < today_ts) & (df["진행률"] < 100))
-            | (
-                (dates >= today_ts)
-                & (dates <= today_ts + pd.Timedelta(days=7))
-                & (df["진행률"] < 100)
-            )
-        )
-        urgent_df = df[cond].copy()
+    if has_due:
+        urgent_mask = overdue_mask | due_soon_mask
+        urgent_df = df[urgent_mask]
+        urgent_due_strs = due_strs[urgent_mask]
     else:
         urgent_df = pd.DataFrame([])
 
@@ -255,38 +426,39 @@ def generate_official_report_text(df: pd.DataFrame) -> str:
         add("- 아래 항목은 마감 7일 이내 또는 기한 경과 미완료 항목입니다.")
         add("")
         max_rows = 30
-        for idx, (_, row) in enumerate(urgent_df.iterrows()):
-            if idx >= max_rows:
-                add(f"... (이하 {len(urgent_df) - max_rows}건 생략)")
-                break
-            area = row.get("평가영역", "")
-            crit = row.get("평가준거", "")
-            title = row.get("보고서 주요내용", "") or row.get("제출자료(예시)", "")
-            title = str(title)[:50]
-            owner = row.get("담당자", "")
-            prog = row.get("진행률", 0)
-            indicator = row.get("표시등", "")
-            due = row.get("마감일", "")
-
-            if isinstance(due, pd.Timestamp):
-                due_str = due.strftime("%Y-%m-%d")
-            else:
-                try:
-                    due_str = pd.to_datetime(due).strftime("%Y-%m-%d")
-                except Exception:
-                    due_str = ""
-
-            add(
-                f"- [{area}/{crit}] {title} / 담당: {owner} / "
-                f"마감: {due_str} / {indicator} {prog}%"
-            )
+        # 행 단위 반복 없이 컬럼 문자열 연산으로 항목 줄을 한 번에 만듦
+        u = urgent_df.head(max_rows)
+        content = u["보고서 주요내용"].astype(str)
+        title = content.where(content != "", u["제출자료(예시)"].astype(str)).str.slice(0, 50)
+        urgent_lines = (
+            "- ["
+            + u["평가영역"].astype(str)
+            + "/"
+            + u["평가준거"].astype(str)
+            + "] "
+            + title
+            + " / 담당: "
+            + u["담당자"].astype(str)
+            + " / 마감: "
+            + urgent_due_strs.head(max_rows)
+            + " / "
+            + u["표시등"].astype(str)
+            + " "
+            + u["진행률"].astype(str)
+            + "%"
+        )
+        lines.extend(urgent_lines.tolist())
+        if len(urgent_df) > max_rows:
+            add(f"... (이하 {len(urgent_df) - max_rows}건 생략)")
     add("")
 
     # 3. 평가영역별 진행
     add("3. 평가영역별 진행 현황 요약")
     if "평가영역" in df.columns and total > 0:
         area_progress = (
-            df.groupby("평가영역")["진행률"].mean().sort_values(ascending=False)
+            df.groupby("평가영역", observed=True)["진행률"]
+            .mean()
+            .sort_values(ascending=False)
         )
         for area, val in area_progress.items():
             add(f"- {area}: 평균 진행률 {val:.1f}%")
@@ -297,11 +469,16 @@ def generate_official_report_text(df: pd.DataFrame) -> str:
     # 4. 담당자별 진행
     add("4. 담당자별 진행 현황")
     if "담당자" in df.columns and total > 0:
-        by_owner = df.copy()
-        by_owner["담당자"] = by_owner["담당자"].fillna("").replace("", "미지정")
+        # 집계에 필요한 컬럼만 모아 전체 프레임 복사를 피함
+        # 완료 여부는 미리 0/1 컬럼으로 만들어 그룹별 합계를 C 경로(sum)로 계산
+        by_owner = pd.DataFrame({
+            "담당자": df["담당자"].replace("", "미지정"),
+            "진행률": df["진행률"],
+            "_done": (df["진행률"] == 100).astype(int),
+        })
         owner_stats = by_owner.groupby("담당자").agg(
-            항목수=("진행률", "count"),
-            완료수=("진행률", lambda s: int((s == 100).sum())),
+            항목수=("진행률", "size"),
+            완료수=("_done", "sum"),
             평균진행률=("진행률", "mean"),
         )
         for owner, row in owner_stats.iterrows():
@@ -325,10 +502,121 @@ def generate_official_report_text(df: pd.DataFrame) -> str:
     return "\n".join(lines)
 
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def generate_official_report_text_cached(
+    _df: pd.DataFrame,
+    report_key: tuple,
+    _overdue_mask: np.ndarray | None = None,
+    _due_soon_mask: np.ndarray | None = None,
+) -> str:
+    """
+    generate_official_report_text의 캐시 버전.
+    _df·마스크는 해싱하지 않고 report_key(데이터 수정 시각·날짜 + 필터·정렬 값)로만
+    캐시하므로, 같은 조건에서 버튼을 다시 눌러도 보고서를 새로 만들지 않는다.
+    """
+    return generate_official_report_text(
+        _df, overdue_mask=_overdue_mask, due_soon_mask=_due_soon_mask
+    )
+
+
 # ─────────────────────
 # 4. 메인 앱 (읽기 전용 UI)
 # ─────────────────────
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def filter_and_sort(
+    _df: pd.DataFrame,
+    data_key: tuple,
+    selected_area: str,
+    selected_krit: str,
+    selected_dept: str,
+    selected_owner: str,
+    selected_indicator: str,
+    sort_option: str,
+) -> pd.DataFrame:
+    """
+    사이드바 필터·정렬을 적용한 DataFrame을 반환한다.
+
+    _df는 캐시 키 계산에서 제외하고(행 전체 해싱 비용 회피), 대신
+    load_data와 같은 data_key(수정 시각·시트 범위·날짜)와 필터 값으로 캐시한다.
+    같은 데이터에서 같은 필터 조합으로 다시 실행되면 다시 계산하지 않음.
+    """
+    df = _df
+
+    # 필터 조건을 마스크 하나로 합쳐 한 번만 잘라냄
+    mask = np.ones(len(df), dtype=bool)
+
+    if selected_area != "전체":
+        mask &= (df["평가영역"] == selected_area).to_numpy(dtype=bool)
+    if selected_krit != "전체":
+        mask &= (df["평가준거"] == selected_krit).to_numpy(dtype=bool)
+    if selected_dept != "전체":
+        mask &= (df["주무부처"] == selected_dept).to_numpy(dtype=bool)
+    if selected_owner != "전체":
+        # 담당자 셀 안에 포함된 이름(복수 입력)까지 고려
+        owner_tokens = split_owners(df["담당자"])
+        mask_owner = owner_tokens.eq(selected_owner).groupby(level=0, sort=False).any()
+        mask &= mask_owner.to_numpy(dtype=bool)
+    if selected_indicator != "전체":
+        color = selected_indicator.split()[0]  # "🔴 위험" -> "🔴"
+        mask &= (df["표시등"] == color).to_numpy(dtype=bool)
+
+    filtered = df[mask]
+
+    # 정렬 (마감일은 load_data에서 이미 날짜형, 표시등은 🔴<🟡<🔵 순서형 category)
+    if sort_option == "위험순 + 마감일순":
+        # 표시등 코드(🔴=0, 🟡=1, 🔵=2)·마감일 배열로 정렬 순서만 구해 한 번에 take
+        # (보조 컬럼·중간 복사본 없음, 마감일 없는 항목(NaT)은 뒤로)
+        rank = filtered["표시등"].cat.codes.to_numpy()
+        due = filtered["마감일"].to_numpy(dtype="datetime64[ns]")
+        filtered = filtered.take(np.lexsort((due, rank)))
+    elif sort_option == "마감일 오름차순":
+        filtered = filtered.sort_values(
+            by=["마감일"],
+            ascending=[True],
+            na_position="last",
+        )
+    elif sort_option == "진행률 내림차순":
+        filtered = filtered.sort_values(by=["진행률"], ascending=[False])
+
+    return filtered
+
+
+@st.fragment
+def report_section(
+    filtered: pd.DataFrame,
+    report_key: tuple,
+    overdue_mask: np.ndarray | None = None,
+    due_soon_mask: np.ndarray | None = None,
+):
+    """
+    공식 보고서 생성 영역.
+    fragment로 분리해 버튼을 눌러도 이 영역만 다시 실행된다
+    (데이터 로드·필터·차트 등 대시보드 전체를 다시 그리지 않음).
+    report_key는 (data_key, 필터·정렬 값)으로, 보고서 텍스트 캐시 키로 쓴다.
+    overdue_mask / due_soon_mask는 상단 요약 카드에서 구한 마스크를 그대로 넘긴다.
+    """
+    st.subheader("📄 공식 보고서 텍스트 생성")
+
+    st.caption(
+        "현재 필터/정렬 상태를 기준으로 공식 보고서 텍스트를 생성합니다. "
+        "다운로드 후 한글/워드에 붙여넣고, 학교 양식에 맞게 다듬어 사용하시면 됩니다."
+    )
+
+    if st.button("📄 TF 공식 보고서(텍스트) 생성"):
+        report_text = generate_official_report_text_cached(
+            filtered, report_key, overdue_mask, due_soon_mask
+        )
+        st.download_button(
+            "📥 다운로드: TF_공식보고서.txt",
+            report_text.encode("utf-8"),
+            file_name="TF_공식보고서.txt",
+            mime="text/plain",
+            on_click="ignore",  # 다운로드는 재실행 없이 처리
+        )
+        st.text_area("보고서 미리보기", report_text, height=300)
+
+
 def main():
     st.title("📊 대학 인증 증빙자료 준비 현황 대시보드")
 
@@ -337,9 +625,14 @@ def main():
         "실제 수정(담당자, 진행률, 마감일 등)은 **구글 스프레드시트에서 직접** 해 주세요."
     )
 
+    today = date.today()
+    today64 = np.datetime64(today, "D")
+
     # 데이터 로딩 시 에러를 잡아서 사용자에게 보여주기
     try:
-        df = load_data()
+        modified_time, value_range = get_sheet_state()
+        data_key = (modified_time, value_range, today.isoformat())
+        df, categories = load_data(*data_key)
     except Exception as e:
         st.error(
             "구글 시트 데이터를 불러오는 중 오류가 발생했습니다.\n\n"
@@ -352,9 +645,8 @@ def main():
         st.warning("증빙자료 시트에 데이터가 없습니다. 구글 시트 내용을 먼저 채워 주세요.")
         return
 
-    # 표시등 계산
-    df = df.copy()
-    df["표시등"] = df.apply(calc_indicator, axis=1)
+    # 마감일은 load_data에서 한 번만 파싱하고, 이후에는 다시 변환하지 않음
+    assert df["마감일"].dtype.kind == "M"
 
     # ───── 사이드바 필터 ─────
     st.sidebar.header("🔎 필터")
@@ -381,35 +673,28 @@ def main():
 
     # 평가영역 필터
     if "평가영역" in df.columns:
-        areas = ["전체"] + sorted(df["평가영역"].dropna().unique().tolist())
+        areas = ["전체"] + categories.get("평가영역", [])
         selected_area = st.sidebar.selectbox("평가영역", areas, index=0)
     else:
         selected_area = "전체"
 
     # 평가준거
     if "평가준거" in df.columns:
-        kriterias = ["전체"] + sorted(df["평가준거"].dropna().unique().tolist())
+        kriterias = ["전체"] + categories.get("평가준거", [])
         selected_krit = st.sidebar.selectbox("평가준거", kriterias, index=0)
     else:
         selected_krit = "전체"
 
     # 주무부처
     if "주무부처" in df.columns:
-        depts = ["전체"] + sorted(df["주무부처"].dropna().unique().tolist())
+        depts = ["전체"] + categories.get("주무부처", [])
         selected_dept = st.sidebar.selectbox("주무부처", depts, index=0)
     else:
         selected_dept = "전체"
 
     # 담당자
     if "담당자" in df.columns:
-        owners = (
-            df["담당자"]
-            .fillna("")
-            .astype(str)
-            .apply(lambda x: [o.strip() for o in x.replace("/", ",").split(",") if o.strip()])
-        )
-        flat_owners = sorted(set([o for sub in owners for o in sub]))
-        owners_options = ["전체"] + flat_owners
+        owners_options = ["전체"] + categories.get("담당자", [])
         selected_owner = st.sidebar.selectbox("담당자(이름 포함 검색)", owners_options, index=0)
     else:
         selected_owner = "전체"
@@ -425,59 +710,37 @@ def main():
         index=0,
     )
 
-    # ── 필터 적용 ──
-    filtered = df.copy()
-
-    if selected_area != "전체":
-        filtered = filtered[filtered["평가영역"] == selected_area]
-    if selected_krit != "전체":
-        filtered = filtered[filtered["평가준거"] == selected_krit]
-    if selected_dept != "전체":
-        filtered = filtered[filtered["주무부처"] == selected_dept]
-    if selected_owner != "전체":
-        # 담당자 셀 안에 포함된 이름(복수 입력)까지 고려
-        mask_owner = filtered["담당자"].fillna("").astype(str).apply(
-            lambda x: selected_owner in [o.strip() for o in x.replace("/", ",").split(",")]
-        )
-        filtered = filtered[mask_owner]
-    if selected_indicator != "전체":
-        color = selected_indicator.split()[0]  # "🔴 위험" -> "🔴"
-        filtered = filtered[filtered["표시등"] == color]
-
-    # 정렬
-    filtered = filtered.copy()
-    if "마감일" in filtered.columns:
-        filtered["마감일"] = pd.to_datetime(filtered["마감일"], errors="coerce")
+    # ── 필터 적용 + 정렬 (같은 데이터·같은 필터 조합이면 캐시된 결과 사용) ──
+    filter_key = (
+        selected_area,
+        selected_krit,
+        selected_dept,
+        selected_owner,
+        selected_indicator,
+        sort_option,
+    )
+    filtered = filter_and_sort(df, data_key, *filter_key)
 
-    if sort_option == "위험순 + 마감일순":
-        indicator_rank = {"🔴": 0, "🟡": 1, "🔵": 2}
-        filtered["표시등_순위"] = filtered["표시등"].map(indicator_rank).fillna(3)
-        filtered = filtered.sort_values(
-            by=["표시등_순위", "마감일"],
-            ascending=[True, True],
-            na_position="last",
-        )
-    elif sort_option == "마감일 오름차순":
-        filtered = filtered.sort_values(
-            by=["마감일"],
-            ascending=[True],
-            na_position="last",
-        )
-    elif sort_option == "진행률 내림차순":
-        filtered = filtered.sort_values(by=["진행률"], ascending=[False])
+    # 필터 결과가 없으면 요약·차트·표·보고서를 만들 것이 없으므로 여기서 끝냄
+    if filtered.empty:
+        st.info("필터 결과가 없습니다. 사이드바 필터를 조정해 보세요.")
+        return
 
     # ───── 상단 요약 카드 ─────
     total = len(filtered)
     done = int((filtered["진행률"] == 100).sum())
-    red = int((filtered["표시등"] == "🔴").sum())
-    yellow = int((filtered["표시등"] == "🟡").sum())
-    blue = int((filtered["표시등"] == "🔵").sum())
+    # 표시등별 개수는 category 정수 코드에 bincount 한 번으로 구해 개요 탭 차트에서도 재사용
+    indicator_counts = np.bincount(
+        filtered["표시등"].cat.codes.to_numpy(), minlength=len(INDICATOR_LEVELS)
+    )
+    red, yellow, blue = (int(c) for c in indicator_counts)
 
+    # 지연·7일 이내 마감 마스크는 여기서 한 번 구해 요약 카드와 보고서에서 함께 사용
     if "마감일" in filtered.columns:
-        dates = pd.to_datetime(filtered["마감일"], errors="coerce")
-        today_ts = pd.Timestamp.today().normalize()
-        overdue = int(((dates < today_ts) & (filtered["진행률"] < 100)).sum())
+        overdue_mask, due_soon_mask = due_masks(filtered, today64)
+        overdue = int(overdue_mask.sum())
     else:
+        overdue_mask = due_soon_mask = None
         overdue = 0
 
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -498,46 +761,31 @@ def main():
     with tab_overview:
         st.subheader("신호등 분포")
 
-        indicator_counts = (
-            filtered["표시등"]
-            .value_counts()
-            .reindex(["🔴", "🟡", "🔵"])
-            .fillna(0)
-            .astype(int)
-        )
-        ind_df = indicator_counts.reset_index()
-        ind_df.columns = ["표시등", "개수"]
-
-        if len(ind_df) > 0:
-            chart = (
-                alt.Chart(ind_df)
-                .mark_bar()
-                .encode(
-                    x=alt.X("표시등:N", title="신호등"),
-                    y=alt.Y("개수:Q", title="항목 수"),
-                    tooltip=["표시등", "개수"],
-                )
-                .properties(height=250)
+        ind_df = pd.DataFrame({"표시등": INDICATOR_LEVELS, "개수": indicator_counts})
+        chart = (
+            alt.Chart(ind_df)
+            .mark_bar()
+            .encode(
+                x=alt.X("표시등:N", title="신호등"),
+                y=alt.Y("개수:Q", title="항목 수"),
+                tooltip=["표시등", "개수"],
             )
-            st.altair_chart(chart, width="stretch")
-        else:
-            st.info("표시할 항목이 없습니다. 사이드바 필터를 조정해 보세요.")
+            .properties(height=250)
+        )
+        st.altair_chart(chart, width="stretch")
 
         st.subheader("평균 진행률 요약")
-        if total > 0:
-            avg_progress = float(filtered["진행률"].mean())
-            st.progress(avg_progress / 100.0)
-            st.write(f"현재 필터 기준 평균 진행률: **{avg_progress:.1f}%**")
-        else:
-            st.write("현재 필터 조건에 해당하는 항목이 없습니다.")
+        avg_progress = float(filtered["진행률"].mean())
+        st.progress(avg_progress / 100.0)
+        st.write(f"현재 필터 기준 평균 진행률: **{avg_progress:.1f}%**")
 
     # ───── 탭 2: 평가영역별 그래프 ─────
     with tab_area:
         st.subheader("평가영역별 평균 진행률")
 
-        if "평가영역" in filtered.columns and len(filtered) > 0:
+        if "평가영역" in filtered.columns:
             area_progress = (
-                filtered.groupby("평가영역")["진행률"]
+                filtered.groupby("평가영역", observed=True, sort=False)["진행률"]
                 .mean()
                 .reset_index()
                 .rename(columns={"진행률": "평균진행률"})
@@ -555,24 +803,24 @@ def main():
             )
             st.altair_chart(area_chart, width="stretch")
         else:
-            st.info("평가영역 정보가 없거나, 필터 결과가 비어 있습니다.")
+            st.info("평가영역 정보가 없습니다.")
 
     # ───── 탭 3: 담당자별 그래프 ─────
     with tab_owner:
         st.subheader("담당자별 진행 현황")
 
-        if "담당자" in filtered.columns and len(filtered) > 0:
-            df_owner = filtered.copy()
-            df_owner["담당자"] = (
-                df_owner["담당자"]
-                .fillna("")
-                .replace("", "미지정")
-                .astype(str)
-            )
-
-            owner_stats = df_owner.groupby("담당자").agg(
-                항목수=("진행률", "count"),
-                완료수=("진행률", lambda s: int((s == 100).sum())),
+        if "담당자" in filtered.columns:
+            # 집계에 필요한 컬럼만 새로 구성 (filtered 전체 복사 없음)
+            df_owner = pd.DataFrame({
+                "담당자": filtered["담당자"].replace("", "미지정"),
+                "진행률": filtered["진행률"],
+                "_done": (filtered["진행률"] == 100).astype(int),
+            })
+
+            # 차트·표에서 다시 정렬하므로 groupby 단계의 키 정렬은 생략
+            owner_stats = df_owner.groupby("담당자", sort=False).agg(
+                항목수=("진행률", "size"),
+                완료수=("_done", "sum"),
                 평균진행률=("진행률", "mean"),
             ).reset_index()
 
@@ -597,7 +845,7 @@ def main():
                 width="stretch",
             )
         else:
-            st.info("담당자 정보가 없거나, 필터 결과가 비어 있습니다.")
+            st.info("담당자 정보가 없습니다.")
 
     # ───── 탭 4: 상세 테이블 (조회 전용) ─────
     with tab_table:
@@ -620,34 +868,27 @@ def main():
         ]
         display_cols = [c for c in display_cols if c in filtered.columns]
 
-        df_show = filtered[display_cols].copy()
-
-        # 날짜 포맷 보기 좋게
-        if "마감일" in df_show.columns:
-            df_show["마감일"] = pd.to_datetime(df_show["마감일"], errors="coerce")
-            df_show["마감일"] = df_show["마감일"].dt.strftime("%Y-%m-%d")
-
-        st.dataframe(df_show, width="stretch", height=450)
+        # 행이 많으면 일부 구간만 화면으로 보내 브라우저 전송·렌더링 부담을 줄임
+        if len(filtered) > TABLE_PAGE_ROWS:
+            start = st.slider("행 시작", 0, len(filtered) - TABLE_PAGE_ROWS, 0)
+            end = start + TABLE_PAGE_ROWS
+            st.caption(f"전체 {len(filtered)}개 중 {start + 1}~{end}번째 항목을 표시합니다.")
+            df_show = filtered.iloc[start:end][display_cols]
+        else:
+            df_show = filtered[display_cols]
+
+        # 날짜 포맷은 문자열로 바꾸지 않고 표 컴포넌트의 열 설정으로 지정
+        st.dataframe(
+            df_show,
+            column_config={"마감일": st.column_config.DateColumn(format="YYYY-MM-DD")},
+            width="stretch",
+            height=450,
+        )
 
     st.write("---")
 
     # ───── 공식 보고서 텍스트 생성 ─────
-    st.subheader("📄 공식 보고서 텍스트 생성")
-
-    st.caption(
-        "현재 필터/정렬 상태를 기준으로 공식 보고서 텍스트를 생성합니다. "
-        "다운로드 후 한글/워드에 붙여넣고, 학교 양식에 맞게 다듬어 사용하시면 됩니다."
-    )
-
-    if st.button("📄 TF 공식 보고서(텍스트) 생성"):
-        report_text = generate_official_report_text(filtered)
-        st.download_button(
-            "📥 다운로드: TF_공식보고서.txt",
-            report_text.encode("utf-8"),
-            file_name="TF_공식보고서.txt",
-            mime="text/plain",
-        )
-        st.text_area("보고서 미리보기", report_text, height=300)
+    report_section(filtered, (data_key, filter_key), overdue_mask, due_soon_mask)
 
 
 if __name__ == "__main__":